@@ -5,6 +5,55 @@ from type.round_state import RoundStateClient
 import itertools
 from collections import Counter
 
+ROUND_PREFLOP = 0
+ROUND_FLOP = 1
+ROUND_TURN = 2
+ROUND_RIVER = 3
+ROUND_MAP = {'Preflop': ROUND_PREFLOP, 'Flop': ROUND_FLOP, 'Turn': ROUND_TURN, 'River': ROUND_RIVER}
+
+def _build_rank_table() -> bytearray:
+    # Unused slots stay 0, which _get_card_rank treats as an unknown rank.
+    table = bytearray(128)
+    for rank, rank_char in enumerate('23456789TJQKA', start=2):
+        table[ord(rank_char)] = rank
+    return table
+
+_RANK_BY_ORD = _build_rank_table()
+
+def _score_starting_hand(high: int, low: int, suited: bool) -> int:
+    if high == low:
+        return high * 2 + 20
+    
+    gap = high - low - 1
+    base = high + low
+    if suited:
+        base += 5
+    
+    if gap == 0:
+        base += 7
+    elif gap == 1:
+        base += 5
+    elif gap == 2:
+        base += 3
+    elif gap == 3:
+        base += 1
+    else:
+        base -= (gap - 3) * 2
+    
+    return base
+
+def _build_preflop_table() -> Dict[Tuple[int, int, bool], int]:
+    # All 169 starting hands, keyed by (high rank, low rank, suited).
+    table = {}
+    for high in range(2, 15):
+        for low in range(2, high + 1):
+            table[(high, low, False)] = _score_starting_hand(high, low, False)
+            if low != high:
+                table[(high, low, True)] = _score_starting_hand(high, low, True)
+    return table
+
+_PREFLOP_STRENGTH = _build_preflop_table()
+
 class SimplePlayer(Bot):
     def __init__(self):
         super().__init__()
@@ -16,19 +65,13 @@ class SimplePlayer(Bot):
         super().set_id(player_id)
 
     def _get_card_rank(self, card: str) -> int:
-        rank_char = card[0]
-        if rank_char == 'A':
-            return 14
-        elif rank_char == 'K':
-            return 13
-        elif rank_char == 'Q':
-            return 12
-        elif rank_char == 'J':
-            return 11
-        elif rank_char == 'T':
-            return 10
-        else:
-            return int(rank_char)
+        try:
+            rank = _RANK_BY_ORD[ord(card[0])]
+        except IndexError:
+            rank = 0
+        if not rank:
+            raise ValueError(f"Unknown card rank: {card!r}")
+        return rank
 
     def _get_card_suit(self, card: str) -> str:
         return card[1]
@@ -106,30 +149,21 @@ class SimplePlayer(Bot):
     def _preflop_strength(self, hole_cards: List[str]) -> int:
         if len(hole_cards) != 2:
             return 0
-            
-        ranks = sorted([self._get_card_rank(card) for card in hole_cards], reverse=True)
-        suits = [self._get_card_suit(card) for card in hole_cards]
-        
-        if ranks[0] == ranks[1]:
-            return ranks[0] * 2 + 20
-        
-        gap = ranks[0] - ranks[1] - 1
-        base = ranks[0] + ranks[1]
-        if suits[0] == suits[1]:
-            base += 5
-        
-        if gap == 0:
-            base += 7
-        elif gap == 1:
-            base += 5
-        elif gap == 2:
-            base += 3
-        elif gap == 3:
-            base += 1
-        else:
-            base -= (gap - 3) * 2
-        
-        return base
+
+        r1 = self._get_card_rank(hole_cards[0])
+        r2 = self._get_card_rank(hole_cards[1])
+        suited = self._get_card_suit(hole_cards[0]) == self._get_card_suit(hole_cards[1])
+        if r1 < r2:
+            r1, r2 = r2, r1
+        return _PREFLOP_STRENGTH[(r1, r2, suited and r1 != r2)]
+
+    def _size_raise(self, multiplier: int, pot: int, min_raise: int, max_raise: int) -> Tuple[PokerAction, int]:
+        raise_amount = min(multiplier * pot, max_raise)
+        if raise_amount >= min_raise:
+            return (PokerAction.RAISE, raise_amount)
+        if min_raise <= max_raise:
+            return (PokerAction.RAISE, min_raise)
+        return (PokerAction.ALL_IN, 0)
 
     def on_start(self, starting_chips: int, player_hands: List[str], blind_amount: int, big_blind_player_id: int, small_blind_player_id: int, all_players: List[int]):
         self.big_blind = blind_amount
@@ -151,7 +185,7 @@ class SimplePlayer(Bot):
         try:
             hole_cards = self.hole_cards
             community_cards = round_state.community_cards
-            current_round = round_state.round
+            current_round = ROUND_MAP.get(round_state.round, ROUND_PREFLOP)
             current_bet = round_state.current_bet
             min_raise = round_state.min_raise
             max_raise = round_state.max_raise
@@ -161,46 +195,28 @@ class SimplePlayer(Bot):
             our_bet = round_state.player_bets.get(our_id_str, 0)
             call_amount = current_bet - our_bet
             
-            if current_round == 'Preflop':
+            if current_round == ROUND_PREFLOP:
                 strength = self._preflop_strength(hole_cards)
             else:
                 rank, _ = self._evaluate_hand(hole_cards, community_cards)
                 strength = rank
             
             if call_amount == 0:
-                if strength >= 80 or (current_round != 'Preflop' and strength >= 6):
-                    raise_amount = min(3 * pot, max_raise)
-                    if raise_amount < min_raise:
-                        if min_raise <= max_raise:
-                            raise_amount = min_raise
-                        else:
-                            return (PokerAction.ALL_IN, 0)
-                    return (PokerAction.RAISE, raise_amount)
+                if strength >= 80 or (current_round != ROUND_PREFLOP and strength >= 6):
+                    return self._size_raise(3, pot, min_raise, max_raise)
                 else:
                     return (PokerAction.CHECK, 0)
             else:
-                if current_round == 'Preflop':
+                if current_round == ROUND_PREFLOP:
                     if strength >= 80:
-                        raise_amount = min(3 * pot, max_raise)
-                        if raise_amount < min_raise:
-                            if min_raise <= max_raise:
-                                raise_amount = min_raise
-                            else:
-                                return (PokerAction.ALL_IN, 0)
-                        return (PokerAction.RAISE, raise_amount)
+                        return self._size_raise(3, pot, min_raise, max_raise)
                     elif strength >= 50:
                         return (PokerAction.CALL, 0)
                     else:
                         return (PokerAction.FOLD, 0)
                 else:
                     if strength >= 6:
-                        raise_amount = min(2 * pot, max_raise)
-                        if raise_amount < min_raise:
-                            if min_raise <= max_raise:
-                                return (PokerAction.RAISE, min_raise)
-                            else:
-                                return (PokerAction.ALL_IN, 0)
-                        return (PokerAction.RAISE, raise_amount)
+                        return self._size_raise(2, pot, min_raise, max_raise)
                     elif strength >= 3:
                         return (PokerAction.CALL, 0)
                     else: